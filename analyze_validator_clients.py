@@ -14,12 +14,51 @@ because they conflate performance with stake-weighted slot assignment.
 Outputs a 4-panel interactive Plotly dashboard focused on normalized performance.
 """
 
+import argparse
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import numpy as np
 import pandas as pd
+import polars as pl
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime
 
 
+SOURCE_PARQUET_PATH = 'pamm_updates_391876700_391976700.parquet'
+# Validator-sorted copy from scripts/sort_parquet_by_validator.py; its row-group
+# statistics let the validator filter skip most of the file. Falls back to the source.
+SORTED_PARQUET_PATH = 'pamm_updates_391876700_391976700_sorted.parquet'
+
+
+def resolve_parquet_path():
+    """
+    Return the sorted copy if it is at least as new as the source, else the source.
+
+    A sorted copy older than the source was made from a previous version of
+    the dataset, so it is ignored (with a warning) until it is regenerated.
+    """
+    if not os.path.exists(SORTED_PARQUET_PATH):
+        return SOURCE_PARQUET_PATH
+    if not os.path.exists(SOURCE_PARQUET_PATH):
+        return SORTED_PARQUET_PATH
+    if os.stat(SORTED_PARQUET_PATH).st_mtime_ns >= os.stat(SOURCE_PARQUET_PATH).st_mtime_ns:
+        return SORTED_PARQUET_PATH
+    print(f"Warning: {SORTED_PARQUET_PATH} is older than {SOURCE_PARQUET_PATH}; "
+          f"reading the source instead (re-run scripts/sort_parquet_by_validator.py)")
+    return SOURCE_PARQUET_PATH
+
+
+PARQUET_PATH = resolve_parquet_path()
+CLIENT_TYPES = ['Jito-solana', 'Harmonic']
+METRICS_CACHE_DIR = '.cache'
+
+log = logging.getLogger(__name__)
+
+
 def parse_client_mapping():
     """
     Parse top_by_client_20260109.txt to create validator-to-client mapping.
@@ -27,75 +66,242 @@ def parse_client_mapping():
     Returns:
         tuple: (validator_mapping dict, validator_counts dict)
     """
-    validator_mapping = {}
-    validator_counts = {'Jito-solana': 0, 'Harmonic': 0}
-
-    print("Parsing validator client mapping from top_by_client_20260109.txt...")
-
-    with open('top_by_client_20260109.txt', 'r') as f:
-        lines = f.readlines()
-
-    # Extract Jito-solana validators (lines 4-23, accounting for 0-indexing: lines[3:23])
-    for i in range(3, 23):  # Lines 4-23 (20 validators)
-        line = lines[i].strip()
-        if line:
-            # Parse line format: "1     22rU5yUmdVThrkoPieVNphqEyAtMQKmZxjwcD8v4bJDU          -          -"
-            parts = line.split()
-            if len(parts) >= 2:
-                validator_id = parts[1]  # Second column is validator ID
-                validator_mapping[validator_id] = 'Jito-solana'
-                validator_counts['Jito-solana'] += 1
-
-    # Extract Harmonic validators (lines 28-42, accounting for 0-indexing: lines[27:42])
-    for i in range(27, 42):  # Lines 28-42 (15 validators)
-        line = lines[i].strip()
-        if line:
-            parts = line.split()
-            if len(parts) >= 2:
-                validator_id = parts[1]
-                validator_mapping[validator_id] = 'Harmonic'
-                validator_counts['Harmonic'] += 1
-
-    print(f"  Loaded {validator_counts['Jito-solana']} Jito-solana validators")
-    print(f"  Loaded {validator_counts['Harmonic']} Harmonic validators")
-    print(f"  Total: {len(validator_mapping)} validators\n")
+    log.debug("Parsing validator client mapping from top_by_client_20260109.txt...")
+
+    # Each section is a fixed block of rows whose second column is the validator ID:
+    # Jito-solana on lines 4-23 (20 validators), Harmonic on lines 28-42 (15 validators)
+    jito_ids = np.loadtxt('top_by_client_20260109.txt', dtype=str, usecols=1, skiprows=3, max_rows=20)
+    harmonic_ids = np.loadtxt('top_by_client_20260109.txt', dtype=str, usecols=1, skiprows=27, max_rows=15)
+
+    validator_mapping = dict(zip(
+        np.concatenate([jito_ids, harmonic_ids]).tolist(),
+        np.repeat(CLIENT_TYPES, [jito_ids.size, harmonic_ids.size]).tolist(),
+    ))
+    validator_counts = {'Jito-solana': jito_ids.size, 'Harmonic': harmonic_ids.size}
+
+    log.debug("  Loaded %d Jito-solana validators", validator_counts['Jito-solana'])
+    log.debug("  Loaded %d Harmonic validators", validator_counts['Harmonic'])
+    log.debug("  Total: %d validators", len(validator_mapping))
 
     return validator_mapping, validator_counts
 
 
-def load_and_enrich_data(validator_mapping):
+def load_and_enrich_data(validator_mapping, check=False):
     """
     Load parquet dataset and enrich with client_type column.
     Filters to only include the 35 mapped validators.
 
+    The scan is lazy and streamed: the validator filter and column selection
+    are pushed down into the Parquet reader, so only the mapped validators'
+    rows and the columns used downstream are ever decoded.
+
     Args:
         validator_mapping: dict mapping validator ID to client type
+        check: run the client-type sanity check (an extra full-column unique())
 
     Returns:
         pandas.DataFrame: Enriched dataset
     """
-    print("Loading parquet dataset...")
-    df = pd.read_parquet('pamm_updates_391876700_391976700.parquet')
-    print(f"  Loaded {len(df):,} total events\n")
+    verbose = log.isEnabledFor(logging.DEBUG)
+
+    log.debug("Loading parquet dataset...")
+    if verbose:
+        total_events = pl.scan_parquet(PARQUET_PATH).select(pl.len()).collect().item()
+        log.debug("  Dataset contains %s total events", f"{total_events:,}")
+
+    log.debug("Filtering to mapped validators only...")
+    validator_ids = list(validator_mapping)
+    lf = (
+        pl.scan_parquet(PARQUET_PATH)
+        .select(['validator', 'time', 'slot', 'kind'])
+        .filter(pl.col('validator').is_in(validator_ids))
+        .with_columns(
+            pl.col('validator').cast(pl.Enum(validator_ids)),
+            # 5-minute bin as epoch seconds; converted to datetimes only on the
+            # aggregated time series
+            (pl.col('time') // 300 * 300).alias('time_bin_5min'),
+        )
+    )
+    # The streaming engine processes row groups in batches, so the scan does not
+    # need the whole file in memory as the dataset grows
+    df_filtered = lf.collect(engine='streaming').to_pandas()
+    if verbose:
+        log.debug("  Filtered to %s events (%.1f%% of dataset)",
+                  f"{len(df_filtered):,}", len(df_filtered) / total_events * 100)
+
+    log.debug("Enriching data with client_type and time features...")
+    # validator arrives as a categorical over validator_ids, so client_type is
+    # a gather of its codes through a per-validator lookup table
+    client_lookup = np.array(
+        [CLIENT_TYPES.index(validator_mapping[v]) for v in validator_ids], dtype=np.int8
+    )
+    df_filtered['client_type'] = pd.Categorical.from_codes(
+        client_lookup[df_filtered['validator'].cat.codes.to_numpy()], categories=CLIENT_TYPES
+    )
+    df_filtered['kind'] = df_filtered['kind'].astype('category')
 
-    print("Filtering to mapped validators only...")
-    df_filtered = df[df['validator'].isin(validator_mapping.keys())].copy()
-    print(f"  Filtered to {len(df_filtered):,} events ({len(df_filtered)/len(df)*100:.1f}% of dataset)\n")
+    # Verify only 2 client types (opt-in: a full pass over the column)
+    if check:
+        unique_clients = df_filtered['client_type'].unique()
+        log.debug("  Client types present: %s", list(unique_clients))
+        assert len(unique_clients) == 2, f"Expected 2 client types, found {len(unique_clients)}"
 
-    print("Enriching data with client_type and time features...")
-    df_filtered['client_type'] = df_filtered['validator'].map(validator_mapping)
-    df_filtered['datetime'] = pd.to_datetime(df_filtered['time'], unit='s')
-    df_filtered['time_bin_5min'] = df_filtered['datetime'].dt.floor('5min')
+    if verbose:
+        time_min, time_max = df_filtered['time'].min(), df_filtered['time'].max()
+        log.debug("  Time range: %s to %s", pd.to_datetime(time_min, unit='s'), pd.to_datetime(time_max, unit='s'))
+        log.debug("  Duration: %.1f hours", (time_max - time_min) / 3600)
 
-    # Verify only 2 client types
-    unique_clients = df_filtered['client_type'].unique()
-    print(f"  Client types present: {list(unique_clients)}")
-    assert len(unique_clients) == 2, f"Expected 2 client types, found {len(unique_clients)}"
+    return df_filtered
 
-    print(f"  Time range: {df_filtered['datetime'].min()} to {df_filtered['datetime'].max()}")
-    print(f"  Duration: {(df_filtered['datetime'].max() - df_filtered['datetime'].min()).total_seconds() / 3600:.1f} hours\n")
 
-    return df_filtered
+def count_events_per_slot(df):
+    """
+    Count events per (client_type, slot) with a single dense bincount.
+
+    Slots are a contiguous block range, so every (client_type, slot) pair
+    maps to a flat index into a (client types x slots) counts array; this
+    replaces the hash-based two-key groupby.
+
+    Args:
+        df: Enriched DataFrame with a categorical client_type column
+
+    Returns:
+        pandas.Series: Event counts indexed by (client_type, slot), observed pairs only
+    """
+    client_dtype = df['client_type'].dtype
+    client_codes = df['client_type'].cat.codes.to_numpy().astype(np.int64)
+    slots = df['slot'].to_numpy().astype(np.int64)
+
+    slot_min = slots.min()
+    n_slots = int(slots.max() - slot_min) + 1
+    n_clients = len(client_dtype.categories)
+
+    counts = np.bincount(
+        client_codes * n_slots + (slots - slot_min), minlength=n_clients * n_slots
+    ).reshape(n_clients, n_slots)
+
+    code_idx, slot_idx = np.nonzero(counts)
+    index = pd.MultiIndex.from_arrays(
+        [pd.Categorical.from_codes(code_idx, dtype=client_dtype), slot_idx + slot_min],
+        names=['client_type', 'slot']
+    )
+    return pd.Series(counts[code_idx, slot_idx], index=index)
+
+
+def calculate_time_efficiency(df):
+    """
+    Average events per slot for each 5-minute bin and client type.
+
+    The average is the number of events in a (bin, client_type) cell divided
+    by the number of distinct slots in it. Both are dense bincounts over a
+    flat (bin x client type) index instead of a three-key groupby + unstack.
+
+    Args:
+        df: Enriched DataFrame with a categorical client_type column
+
+    Returns:
+        pandas.DataFrame: Bins (datetime index) x client types, NaN where a
+        client produced no slots in a bin
+    """
+    client_types = df['client_type'].cat.categories
+    client_codes = df['client_type'].cat.codes.to_numpy().astype(np.int64)
+    bins = df['time_bin_5min'].to_numpy().astype(np.int64)
+    slots = df['slot'].to_numpy().astype(np.int64)
+
+    bin_min = bins.min()
+    bin_idx = (bins - bin_min) // 300
+    n_cells = (int(bin_idx.max()) + 1) * len(client_types)
+    cells = bin_idx * len(client_types) + client_codes
+
+    cell_events = np.bincount(cells, minlength=n_cells)
+    # Distinct (cell, slot) pairs, then how many fall in each cell
+    slot_offsets = slots - slots.min()
+    n_slots = int(slot_offsets.max()) + 1
+    cell_slots = np.bincount(np.unique(cells * n_slots + slot_offsets) // n_slots, minlength=n_cells)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = (cell_events / cell_slots).reshape(-1, len(client_types))
+
+    time_efficiency = pd.DataFrame(
+        avg,
+        index=pd.to_datetime(bin_min + 300 * np.arange(len(avg)), unit='s').rename('time_bin_5min'),
+        columns=pd.Index(client_types, name='client_type')
+    )
+    # Bins where neither client produced a slot were absent from the grouped result
+    return time_efficiency.dropna(how='all')
+
+
+def calculate_type_breakdown(df):
+    """
+    Event counts and average events per slot for each client type and event kind.
+
+    Both come from one dense bincount over a flat (client type x kind x slot)
+    index: summing over slots gives the event breakdown, and dividing by the
+    number of slots with at least one event of that kind gives the average.
+
+    Args:
+        df: Enriched DataFrame with categorical client_type and kind columns
+
+    Returns:
+        tuple: (efficiency_by_type DataFrame, event_breakdown DataFrame),
+        both client types x kinds
+    """
+    client_types = df['client_type'].cat.categories
+    kinds = df['kind'].cat.categories
+    client_codes = df['client_type'].cat.codes.to_numpy().astype(np.int64)
+    kind_codes = df['kind'].cat.codes.to_numpy().astype(np.int64)
+    slots = df['slot'].to_numpy().astype(np.int64)
+
+    slot_offsets = slots - slots.min()
+    n_slots = int(slot_offsets.max()) + 1
+    n_cells = len(client_types) * len(kinds)
+
+    counts = np.bincount(
+        (client_codes * len(kinds) + kind_codes) * n_slots + slot_offsets, minlength=n_cells * n_slots
+    ).reshape(len(client_types), len(kinds), n_slots)
+
+    index = pd.Index(client_types, name='client_type')
+    columns = pd.Index(kinds, name='kind')
+    event_totals = counts.sum(axis=2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg = event_totals / np.count_nonzero(counts, axis=2)
+
+    efficiency_by_type = pd.DataFrame(avg, index=index, columns=columns).fillna(0)
+    event_breakdown = pd.DataFrame(event_totals, index=index, columns=columns)
+    return efficiency_by_type, event_breakdown
+
+
+def calculate_box_stats(events_per_slot):
+    """
+    Box-plot statistics of events per slot for each client type.
+
+    Mirrors what Plotly derives from raw samples (linear quartiles, whiskers
+    at the most extreme values within 1.5 IQR), so the dashboard can draw the
+    boxes without embedding every slot. Outliers are kept as their distinct
+    values only, since repeated values plot as the same marker.
+
+    Args:
+        events_per_slot: Series of event counts indexed by (client_type, slot)
+
+    Returns:
+        pandas.DataFrame: One row per client type with q1, median, q3,
+        lowerfence, upperfence and outliers (numpy array) columns
+    """
+    rows = {}
+    for client_type, counts in events_per_slot.groupby('client_type', observed=True, sort=False):
+        values = counts.to_numpy()
+        q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        inside = (values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)
+        rows[client_type] = {
+            'q1': q1,
+            'median': median,
+            'q3': q3,
+            'lowerfence': values[inside].min(),
+            'upperfence': values[inside].max(),
+            'outliers': np.unique(values[~inside]),
+        }
+    return pd.DataFrame.from_dict(rows, orient='index')
 
 
 def calculate_metrics(df, validator_counts):
@@ -112,45 +318,92 @@ def calculate_metrics(df, validator_counts):
     Returns:
         dict: All calculated metrics
     """
-    print("Calculating properly normalized metrics...")
+    log.debug("Calculating properly normalized metrics...")
     metrics = {}
 
     # PRIMARY METRIC: Events per slot (performance when producing blocks)
-    events_per_slot = df.groupby(['client_type', 'slot']).size()
-    efficiency_stats = events_per_slot.groupby('client_type').agg(['mean', 'median', 'std', 'count'])
+    # Computed once; the per-client totals below are derived from it rather
+    # than from further passes over the event frame
+    events_per_slot = count_events_per_slot(df)
+    efficiency_stats = events_per_slot.groupby('client_type', observed=True, sort=False).agg(['mean', 'median', 'std', 'count', 'sum'])
 
     # Add coefficient of variation (std/mean) - measures consistency
     efficiency_stats['cv'] = efficiency_stats['std'] / efficiency_stats['mean']
-    metrics['efficiency_stats'] = efficiency_stats
+    metrics['efficiency_stats'] = efficiency_stats.drop(columns='sum')
 
-    # Distribution for box plots
-    efficiency_distribution = events_per_slot.reset_index(name='events')
-    metrics['efficiency_distribution'] = efficiency_distribution
+    # Distribution for box plots (precomputed box statistics, not one row per slot)
+    metrics['efficiency_distribution'] = calculate_box_stats(events_per_slot)
 
     # Events per slot over time (5-minute bins) - normalized time series
-    time_efficiency = df.groupby(['time_bin_5min', 'client_type', 'slot']).size()
-    time_efficiency_avg = time_efficiency.groupby(['time_bin_5min', 'client_type']).mean().unstack()
-    metrics['time_efficiency'] = time_efficiency_avg
+    metrics['time_efficiency'] = calculate_time_efficiency(df)
 
     # Events per slot by event type (ORACLE vs TRADE efficiency)
-    events_per_slot_by_type = df.groupby(['client_type', 'slot', 'kind']).size()
-    efficiency_by_type = events_per_slot_by_type.groupby(['client_type', 'kind']).mean().unstack(fill_value=0)
+    efficiency_by_type, event_breakdown = calculate_type_breakdown(df)
     metrics['efficiency_by_type'] = efficiency_by_type
 
     # Event type proportions (for context)
-    event_breakdown = df.groupby(['client_type', 'kind']).size().unstack(fill_value=0)
     event_breakdown_pct = event_breakdown.div(event_breakdown.sum(axis=1), axis=0) * 100
     metrics['event_breakdown_pct'] = event_breakdown_pct
 
     # Store validator counts and total blocks for context
     metrics['validator_counts'] = validator_counts
-    metrics['total_blocks'] = df.groupby('client_type')['slot'].nunique()
-    metrics['total_events'] = df.groupby('client_type').size()
+    metrics['total_blocks'] = efficiency_stats['count']
+    metrics['total_events'] = efficiency_stats['sum']
 
-    print("  ✓ Block packing efficiency calculated (events per slot)")
-    print("  ✓ Performance consistency metrics computed")
-    print("  ✓ Time-based efficiency patterns analyzed")
-    print("  ✓ Event type efficiency breakdown completed\n")
+    log.debug("  ✓ Block packing efficiency calculated (events per slot)")
+    log.debug("  ✓ Performance consistency metrics computed")
+    log.debug("  ✓ Time-based efficiency patterns analyzed")
+    log.debug("  ✓ Event type efficiency breakdown completed")
+
+    return metrics
+
+
+def load_cached_metrics(validator_mapping, validator_counts, check=False):
+    """
+    Return metrics for the current dataset, computing them only on a cache miss.
+
+    Metrics are pickled under METRICS_CACHE_DIR keyed by the parquet file's
+    mtime, a hash of the validator mapping and a hash of the source of the
+    functions that produce them, so re-runs while iterating on the
+    visualization skip the load and aggregation entirely, while any change to
+    the loading or metric code invalidates the cached pickle.
+
+    Args:
+        validator_mapping: dict mapping validator ID to client type
+        validator_counts: dict with validator counts per client type
+        check: run the data sanity checks; this bypasses the cache read so they actually run
+
+    Returns:
+        dict: All calculated metrics
+    """
+    producers = (load_and_enrich_data, count_events_per_slot, calculate_time_efficiency,
+                 calculate_type_breakdown, calculate_box_stats, calculate_metrics)
+    key_hash = hashlib.blake2b(
+        repr(sorted(validator_mapping.items())).encode()
+        + "".join(inspect.getsource(f) for f in producers).encode(),
+        digest_size=16
+    ).hexdigest()
+    mtime_ns = os.stat(PARQUET_PATH).st_mtime_ns
+    cache_path = os.path.join(METRICS_CACHE_DIR, f"metrics_{mtime_ns}_{key_hash}.pkl")
+
+    if not check and os.path.exists(cache_path):
+        log.debug("Loading cached metrics from %s", cache_path)
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # e.g. a file truncated by an interrupted run: recompute and overwrite it
+            log.warning("Ignoring unreadable metrics cache %s (%s)", cache_path, e)
+
+    df = load_and_enrich_data(validator_mapping, check=check)
+    metrics = calculate_metrics(df, validator_counts)
+
+    # Write to a temporary name and swap in, so an interrupted run never leaves a partial pickle
+    os.makedirs(METRICS_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(metrics, f)
+    os.replace(tmp_path, cache_path)
 
     return metrics
 
@@ -165,7 +418,7 @@ def create_visualization(metrics):
     Args:
         metrics: dict of calculated metrics
     """
-    print("Creating 4-panel visualization dashboard...")
+    log.debug("Creating 4-panel visualization dashboard...")
 
     # Color scheme
     colors = {
@@ -192,12 +445,12 @@ def create_visualization(metrics):
         horizontal_spacing=0.15
     )
 
-    # Panel 1: Events per slot over time (normalized time series)
+    # Panel 1: Events per slot over time (normalized time series), drawn with WebGL
     time_efficiency = metrics['time_efficiency']
     for client_type in ['Jito-solana', 'Harmonic']:
         if client_type in time_efficiency.columns:
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=time_efficiency.index,
                     y=time_efficiency[client_type],
                     name=client_type,
@@ -213,11 +466,16 @@ def create_visualization(metrics):
     client_types = ['Jito-solana', 'Harmonic']
     efficiency_stats = metrics['efficiency_stats']
 
-    # Mean efficiency
+    # Mean efficiency with std error bars
     fig.add_trace(
         go.Bar(
             x=client_types,
-            y=[efficiency_stats.loc[ct, 'mean'] for ct in client_types],
+            y=efficiency_stats.loc[client_types, 'mean'].to_numpy(),
+            error_y=dict(
+                type='data',
+                array=efficiency_stats.loc[client_types, 'std'].to_numpy(),
+                visible=True
+            ),
             name='Mean Events/Slot',
             marker_color=[colors[ct] for ct in client_types],
             hovertemplate='<b>%{x}</b><br>Mean Events/Slot: %{y:.2f}<extra></extra>',
@@ -226,30 +484,35 @@ def create_visualization(metrics):
         row=2, col=1
     )
 
-    # Add error bars for std
-    fig.update_traces(
-        error_y=dict(
-            type='data',
-            array=[efficiency_stats.loc[ct, 'std'] for ct in client_types],
-            visible=True
-        ),
-        row=2, col=1
-    )
-
-    # Panel 3: Box Plot - Efficiency Distribution
+    # Panel 3: Box Plot - Efficiency Distribution (from precomputed statistics)
+    box_stats = metrics['efficiency_distribution']
     for client_type in client_types:
-        client_data = metrics['efficiency_distribution'][
-            metrics['efficiency_distribution']['client_type'] == client_type
-        ]
+        stats = box_stats.loc[client_type]
         fig.add_trace(
             go.Box(
-                y=client_data['events'],
+                x=[client_type],
+                q1=[stats['q1']],
+                median=[stats['median']],
+                q3=[stats['q3']],
+                lowerfence=[stats['lowerfence']],
+                upperfence=[stats['upperfence']],
                 name=client_type,
                 marker_color=colors[client_type],
                 hovertemplate='<b>%{fullData.name}</b><br>Events/Slot: %{y}<extra></extra>'
             ),
             row=2, col=2
         )
+        fig.add_trace(
+            go.Scatter(
+                x=[client_type] * len(stats['outliers']),
+                y=stats['outliers'],
+                mode='markers',
+                marker=dict(color=colors[client_type], size=4),
+                showlegend=False,
+                hovertemplate=f'<b>{client_type}</b><br>Events/Slot: %{{y}}<extra></extra>'
+            ),
+            row=2, col=2
+        )
 
     # Panel 4: Events per slot by event type (ORACLE vs TRADE efficiency)
     efficiency_by_type = metrics['efficiency_by_type']
@@ -296,10 +559,16 @@ def create_visualization(metrics):
         hovermode='closest'
     )
 
-    # Save to HTML
+    # Save to HTML, loading plotly.js from the CDN instead of embedding the ~3MB bundle
     output_path = 'validator_client_analysis_20260110.html'
-    fig.write_html(output_path)
-    print(f"  ✓ Dashboard saved to: {output_path}\n")
+    fig.write_html(
+        output_path,
+        include_plotlyjs='cdn',
+        include_mathjax=False,
+        config={'responsive': True},
+        validate=False
+    )
+    log.debug("  ✓ Dashboard saved to: %s", output_path)
 
     return output_path
 
@@ -314,11 +583,11 @@ def print_summary(metrics):
     Args:
         metrics: dict of calculated metrics
     """
-    efficiency_stats = metrics['efficiency_stats']
+    # Resolve every value once into plain dicts; the formatting below does no pandas lookups
+    efficiency_stats = metrics['efficiency_stats'].to_dict('index')
     validator_counts = metrics['validator_counts']
-    total_blocks = metrics['total_blocks']
-    total_events = metrics['total_events']
-    event_breakdown_pct = metrics['event_breakdown_pct']
+    total_blocks = metrics['total_blocks'].to_dict()
+    total_events = metrics['total_events'].to_dict()
 
     print("=" * 120)
     print("=== Validator Client Performance Analysis: Block Packing Efficiency ===")
@@ -336,10 +605,10 @@ def print_summary(metrics):
 
     # Table rows
     for client_type in ['Jito-solana', 'Harmonic']:
-        mean_val = efficiency_stats.loc[client_type, 'mean']
-        std_val = efficiency_stats.loc[client_type, 'std']
-        median_val = efficiency_stats.loc[client_type, 'median']
-        cv_val = efficiency_stats.loc[client_type, 'cv']
+        mean_val = efficiency_stats[client_type]['mean']
+        std_val = efficiency_stats[client_type]['std']
+        median_val = efficiency_stats[client_type]['median']
+        cv_val = efficiency_stats[client_type]['cv']
 
         print(f"{client_type:<15} | {validator_counts[client_type]:>10} | "
               f"{total_blocks[client_type]:>12,} | "
@@ -352,14 +621,14 @@ def print_summary(metrics):
     print("=" * 120)
 
     # Calculate ratios and differences
-    jito_mean = efficiency_stats.loc['Jito-solana', 'mean']
-    harmonic_mean = efficiency_stats.loc['Harmonic', 'mean']
+    jito_mean = efficiency_stats['Jito-solana']['mean']
+    harmonic_mean = efficiency_stats['Harmonic']['mean']
     efficiency_ratio = jito_mean / harmonic_mean if harmonic_mean > 0 else 0
     efficiency_diff = jito_mean - harmonic_mean
     efficiency_diff_pct = (efficiency_diff / harmonic_mean * 100) if harmonic_mean > 0 else 0
 
-    jito_cv = efficiency_stats.loc['Jito-solana', 'cv']
-    harmonic_cv = efficiency_stats.loc['Harmonic', 'cv']
+    jito_cv = efficiency_stats['Jito-solana']['cv']
+    harmonic_cv = efficiency_stats['Harmonic']['cv']
 
     print(f"Block Packing Efficiency (Mean Events/Slot):")
     print(f"  Jito-solana:  {jito_mean:.2f} events/slot")
@@ -387,14 +656,22 @@ def print_summary(metrics):
     print("IMPORTANT: Any difference in total transaction volume between client types")
     print("is primarily due to stake-weighted slot assignment, NOT performance differences.")
     print()
-    print(f"Context: These 35 validators processed {total_events.sum():,} total events")
-    print(f"         across {total_blocks.sum():,} unique blocks (~{total_blocks.sum() / 100:.1f}k blocks)")
+    print(f"Context: These 35 validators processed {sum(total_events.values()):,} total events")
+    print(f"         across {sum(total_blocks.values()):,} unique blocks (~{sum(total_blocks.values()) / 100:.1f}k blocks)")
     print("=" * 120)
     print()
 
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="log pipeline progress and dataset statistics")
+    parser.add_argument('--check', action='store_true',
+                        help="run data sanity checks (recomputes metrics instead of using the cache)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format='%(message)s')
+
     print("\n" + "=" * 80)
     print("  VALIDATOR CLIENT PERFORMANCE ANALYSIS")
     print("  Block Packing Efficiency: Jito-solana vs Harmonic")
@@ -404,11 +681,8 @@ def main():
     # Step 1: Parse mapping
     mapping, validator_counts = parse_client_mapping()
 
-    # Step 2: Load and enrich data
-    df = load_and_enrich_data(mapping)
-
-    # Step 3: Calculate metrics
-    metrics = calculate_metrics(df, validator_counts)
+    # Steps 2-3: Load and enrich data, calculate metrics (cached on disk)
+    metrics = load_cached_metrics(mapping, validator_counts, check=args.check)
 
     # Step 4: Create visualization
     output_path = create_visualization(metrics)
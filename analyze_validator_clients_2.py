@@ -14,12 +14,51 @@ because they conflate performance with stake-weighted slot assignment.
 Outputs a 4-panel interactive Plotly dashboard focused on normalized performance.
 """
 
+import hashlib
+import inspect
+import os
+import re
+import numpy as np
 import pandas as pd
+import polars as pl
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime
 
 
+SOURCE_PARQUET_PATH = 'pamm_updates_391876700_391976700.parquet'
+# Validator-sorted copy from scripts/sort_parquet_by_validator.py; its row-group
+# statistics let the validator filter skip most of the file. Falls back to the source.
+SORTED_PARQUET_PATH = 'pamm_updates_391876700_391976700_sorted.parquet'
+
+
+def resolve_parquet_path():
+    """
+    Return the sorted copy if it is at least as new as the source, else the source.
+
+    A sorted copy older than the source was made from a previous version of
+    the dataset, so it is ignored (with a warning) until it is regenerated.
+    """
+    if not os.path.exists(SORTED_PARQUET_PATH):
+        return SOURCE_PARQUET_PATH
+    if not os.path.exists(SOURCE_PARQUET_PATH):
+        return SORTED_PARQUET_PATH
+    if os.stat(SORTED_PARQUET_PATH).st_mtime_ns >= os.stat(SOURCE_PARQUET_PATH).st_mtime_ns:
+        return SORTED_PARQUET_PATH
+    print(f"Warning: {SORTED_PARQUET_PATH} is older than {SOURCE_PARQUET_PATH}; "
+          f"reading the source instead (re-run scripts/sort_parquet_by_validator.py)")
+    return SOURCE_PARQUET_PATH
+
+
+PARQUET_PATH = resolve_parquet_path()
+CLIENT_TYPES = ['Jito-solana', 'Harmonic']
+DATA_CACHE_DIR = '.cache'
+
+CLIENT_SECTION_RE = re.compile(r'^=== Top \d+ Validators for (\S+) ===$', re.M)
+# "<rank>  <base58 validator ID> ..." rows
+RANKED_VALIDATOR_RE = re.compile(r'^\s*\d+\s+([1-9A-HJ-NP-Za-km-z]{43,44})\b', re.M)
+
+
 def parse_client_mapping():
     """
     Parse top_by_client_20260109.txt to create validator-to-client mapping.
@@ -33,28 +72,16 @@ def parse_client_mapping():
     print("Parsing validator client mapping from top_by_client_20260109.txt...")
 
     with open('top_by_client_20260109.txt', 'r') as f:
-        lines = f.readlines()
-
-    # Extract Jito-solana validators (lines 4-23, accounting for 0-indexing: lines[3:23])
-    for i in range(3, 23):  # Lines 4-23 (20 validators)
-        line = lines[i].strip()
-        if line:
-            # Parse line format: "1     22rU5yUmdVThrkoPieVNphqEyAtMQKmZxjwcD8v4bJDU          -          -"
-            parts = line.split()
-            if len(parts) >= 2:
-                validator_id = parts[1]  # Second column is validator ID
-                validator_mapping[validator_id] = 'Jito-solana'
-                validator_counts['Jito-solana'] += 1
-
-    # Extract Harmonic validators (lines 28-42, accounting for 0-indexing: lines[27:42])
-    for i in range(27, 42):  # Lines 28-42 (15 validators)
-        line = lines[i].strip()
-        if line:
-            parts = line.split()
-            if len(parts) >= 2:
-                validator_id = parts[1]
-                validator_mapping[validator_id] = 'Harmonic'
-                validator_counts['Harmonic'] += 1
+        content = f.read()
+
+    # Split on the "=== Top N Validators for <client> ===" headers, then take the
+    # validator ID from every ranked row in each client's section
+    sections = CLIENT_SECTION_RE.split(content)
+    for client_type, section in zip(sections[1::2], sections[2::2]):
+        if client_type in validator_counts:
+            validator_ids = RANKED_VALIDATOR_RE.findall(section)
+            validator_mapping.update(dict.fromkeys(validator_ids, client_type))
+            validator_counts[client_type] = len(validator_ids)
 
     print(f"  Loaded {validator_counts['Jito-solana']} Jito-solana validators")
     print(f"  Loaded {validator_counts['Harmonic']} Harmonic validators")
@@ -68,6 +95,11 @@ def load_and_enrich_data(validator_mapping):
     Load parquet dataset and enrich with client_type column.
     Filters to only include the 35 mapped validators.
 
+    The load is a single lazy Polars scan: the validator filter and column
+    selection are pushed into the Parquet reader and the time features are
+    derived in the same plan, which is collected once with the streaming
+    engine.
+
     Args:
         validator_mapping: dict mapping validator ID to client type
 
@@ -75,29 +107,194 @@ def load_and_enrich_data(validator_mapping):
         pandas.DataFrame: Enriched dataset
     """
     print("Loading parquet dataset...")
-    df = pd.read_parquet('pamm_updates_391876700_391976700.parquet')
-    print(f"  Loaded {len(df):,} total events\n")
+    total_events = pl.scan_parquet(PARQUET_PATH).select(pl.len()).collect().item()
+    print(f"  Dataset contains {total_events:,} total events\n")
 
     print("Filtering to mapped validators only...")
-    df_filtered = df[df['validator'].isin(validator_mapping.keys())].copy()
-    print(f"  Filtered to {len(df_filtered):,} events ({len(df_filtered)/len(df)*100:.1f}% of dataset)\n")
+    validator_ids = list(validator_mapping)
+    lf = (
+        pl.scan_parquet(PARQUET_PATH)
+        .select(['validator', 'time', 'slot', 'kind'])
+        .filter(pl.col('validator').is_in(validator_ids))
+        .with_columns(
+            # Both string keys arrive in pandas as categoricals, so the later
+            # groupbys run on integer codes
+            pl.col('validator').cast(pl.Enum(validator_ids)),
+            pl.col('kind').cast(pl.Categorical),
+            # Slots (~4e8) and epoch seconds both fit in 32 bits; the strict
+            # cast raises instead of wrapping if that ever stops being true
+            pl.col('slot').cast(pl.UInt32),
+            pl.col('time').cast(pl.UInt32),
+            # 5-minute bin as epoch seconds; converted to datetimes only on the
+            # aggregated time series
+            (pl.col('time').cast(pl.UInt32) // 300 * 300).alias('time_bin_5min'),
+        )
+    )
+    df_filtered = lf.collect(engine='streaming').to_pandas()
+    print(f"  Filtered to {len(df_filtered):,} events ({len(df_filtered)/total_events*100:.1f}% of dataset)\n")
 
     print("Enriching data with client_type and time features...")
-    df_filtered['client_type'] = df_filtered['validator'].map(validator_mapping)
-    df_filtered['datetime'] = pd.to_datetime(df_filtered['time'], unit='s')
-    df_filtered['time_bin_5min'] = df_filtered['datetime'].dt.floor('5min')
+    # validator arrives as a categorical over validator_ids, so client_type is
+    # a gather of its codes through a per-validator lookup table
+    client_lookup = np.array(
+        [CLIENT_TYPES.index(validator_mapping[v]) for v in validator_ids], dtype=np.int8
+    )
+    df_filtered['client_type'] = pd.Categorical.from_codes(
+        client_lookup[df_filtered['validator'].cat.codes.to_numpy()], categories=CLIENT_TYPES
+    )
 
     # Verify only 2 client types
     unique_clients = df_filtered['client_type'].unique()
     print(f"  Client types present: {list(unique_clients)}")
     assert len(unique_clients) == 2, f"Expected 2 client types, found {len(unique_clients)}"
 
-    print(f"  Time range: {df_filtered['datetime'].min()} to {df_filtered['datetime'].max()}")
-    print(f"  Duration: {(df_filtered['datetime'].max() - df_filtered['datetime'].min()).total_seconds() / 3600:.1f} hours\n")
+    # Range is taken on the epoch seconds; no per-row datetime column is kept
+    start, end = pd.to_datetime([df_filtered['time'].min(), df_filtered['time'].max()], unit='s')
+    print(f"  Time range: {start} to {end}")
+    print(f"  Duration: {(end - start).total_seconds() / 3600:.1f} hours\n")
 
     return df_filtered
 
 
+def load_cached_data(validator_mapping):
+    """
+    Return the enriched dataset, reading the parquet only on a cache miss.
+
+    The filtered frame is written to a Feather (Arrow IPC) file under
+    DATA_CACHE_DIR keyed by the parquet file's mtime and a hash of the
+    validator mapping and of load_and_enrich_data's source (so edits to the
+    loader invalidate it); re-runs read the Arrow file back instead of
+    decoding and filtering the parquet.
+    Categorical and uint32 columns round-trip unchanged.
+
+    Args:
+        validator_mapping: dict mapping validator ID to client type
+
+    Returns:
+        pandas.DataFrame: Enriched dataset
+    """
+    key_hash = hashlib.blake2b(
+        repr(sorted(validator_mapping.items())).encode()
+        + inspect.getsource(load_and_enrich_data).encode(),
+        digest_size=16
+    ).hexdigest()
+    mtime_ns = os.stat(PARQUET_PATH).st_mtime_ns
+    cache_path = os.path.join(DATA_CACHE_DIR, f"filtered_{mtime_ns}_{key_hash}.feather")
+
+    if os.path.exists(cache_path):
+        print(f"Loading cached dataset from {cache_path}\n")
+        try:
+            return pd.read_feather(cache_path)
+        except Exception as e:
+            # e.g. a file truncated by an interrupted run: reload and overwrite it
+            print(f"Ignoring unreadable dataset cache {cache_path} ({e})\n")
+
+    df_filtered = load_and_enrich_data(validator_mapping)
+
+    # Write to a temporary name and swap in, so an interrupted run never leaves a partial file
+    os.makedirs(DATA_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    df_filtered.to_feather(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+    return df_filtered
+
+
+def count_events_per_slot(df):
+    """
+    Count events per (client_type, slot) from one sort of the integer keys.
+
+    Rows are lexsorted by (client code, slot); each run of equal keys is one
+    group, and its length is the event count.
+
+    Args:
+        df: Enriched DataFrame with a categorical client_type column
+
+    Returns:
+        pandas.Series: Event counts indexed by (client_type, slot)
+    """
+    client_codes = df['client_type'].cat.codes.to_numpy()
+    slots = df['slot'].to_numpy()
+
+    order = np.lexsort((slots, client_codes))
+    client_codes, slots = client_codes[order], slots[order]
+
+    # Group boundaries: first row, then wherever either key changes
+    is_start = np.empty(len(order), dtype=bool)
+    is_start[:1] = True
+    is_start[1:] = (client_codes[1:] != client_codes[:-1]) | (slots[1:] != slots[:-1])
+    starts = np.flatnonzero(is_start)
+    counts = np.diff(np.append(starts, len(order)))
+
+    index = pd.MultiIndex.from_arrays(
+        [pd.Categorical.from_codes(client_codes[starts], dtype=df['client_type'].dtype), slots[starts]],
+        names=['client_type', 'slot']
+    )
+    return pd.Series(counts, index=index)
+
+
+def split_counts_by_client(events_per_slot):
+    """
+    Split per-slot event counts into numpy (slots, events) arrays per client.
+
+    count_events_per_slot returns groups sorted by client code, so each
+    client is the contiguous run located by a searchsorted on the codes; no
+    reset_index frame is built.
+
+    Args:
+        events_per_slot: Series from count_events_per_slot
+
+    Returns:
+        dict: Client type -> (slots, events) numpy arrays, empty for clients
+        with no events
+    """
+    client_codes = events_per_slot.index.codes[0]
+    slots = events_per_slot.index.get_level_values('slot').to_numpy()
+    events = events_per_slot.to_numpy()
+
+    client_points = {}
+    for code, client_type in enumerate(events_per_slot.index.levels[0]):
+        lo, hi = np.searchsorted(client_codes, [code, code + 1])
+        client_points[client_type] = (slots[lo:hi], events[lo:hi])
+    return client_points
+
+
+def summarize_events_per_slot(events_per_slot):
+    """
+    Per-client mean, median, std, count and sum of events per slot.
+
+    count_events_per_slot returns groups sorted by client code, so each
+    client's counts are one contiguous run. Sums and sums of squares come
+    from one np.add.reduceat pass over the runs, and medians from a
+    partition of each run, instead of one groupby dispatch per statistic.
+
+    Args:
+        events_per_slot: Series from count_events_per_slot
+
+    Returns:
+        pandas.DataFrame: One row per client type with mean, median, std
+        (ddof=1), count and sum columns
+    """
+    client_codes = events_per_slot.index.codes[0]
+    counts = events_per_slot.to_numpy().astype(np.float64)
+
+    starts = np.flatnonzero(np.r_[True, client_codes[1:] != client_codes[:-1]])
+    n = np.diff(np.append(starts, len(counts)))
+    total = np.add.reduceat(counts, starts)
+    total_sq = np.add.reduceat(counts * counts, starts)
+
+    mean = total / n
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.sqrt((total_sq - n * mean * mean) / (n - 1))
+    median = [np.median(run) for run in np.split(counts, starts[1:])]
+
+    client_types = events_per_slot.index.levels[0][client_codes[starts]]
+    return pd.DataFrame(
+        {'mean': mean, 'median': median, 'std': std, 'count': n, 'sum': total.astype(np.int64)},
+        index=pd.CategoricalIndex(client_types, dtype=events_per_slot.index.levels[0].dtype, name='client_type')
+    )
+
+
 def calculate_metrics(df, validator_counts):
     """
     Compute properly normalized performance metrics.
@@ -116,82 +313,69 @@ def calculate_metrics(df, validator_counts):
     metrics = {}
 
     # PRIMARY METRIC: Events per slot (performance when producing blocks)
-    events_per_slot = df.groupby(['client_type', 'slot']).size()
-    efficiency_stats = events_per_slot.groupby('client_type').agg(['mean', 'median', 'std', 'count'])
+    # Computed once; the statistics, distribution, scatter and per-client
+    # totals below are all views of this one aggregate
+    events_per_slot = count_events_per_slot(df)
+    efficiency_stats = summarize_events_per_slot(events_per_slot)
 
     # Add coefficient of variation (std/mean) - measures consistency
     efficiency_stats['cv'] = efficiency_stats['std'] / efficiency_stats['mean']
-    metrics['efficiency_stats'] = efficiency_stats
+    metrics['efficiency_stats'] = efficiency_stats.drop(columns='sum')
 
-    # Distribution for box plots
-    efficiency_distribution = events_per_slot.reset_index(name='events')
-    metrics['efficiency_distribution'] = efficiency_distribution
-
-    # Scatter plot data (raw events per slot by slot number)
-    scatter_data = events_per_slot.reset_index()
-    scatter_data.columns = ['client_type', 'slot', 'events']
+    # Scatter plot data (raw events per slot by slot number), also the box plot
+    # distribution: per-client (slots, events) numpy arrays
+    scatter_data = split_counts_by_client(events_per_slot)
     metrics['scatter_data'] = scatter_data
+    metrics['efficiency_distribution'] = scatter_data
 
     # Events per slot over time (5-minute bins) - normalized time series
-    time_efficiency = df.groupby(['time_bin_5min', 'client_type', 'slot']).size()
-    time_efficiency_avg = time_efficiency.groupby(['time_bin_5min', 'client_type']).mean().unstack()
+    time_efficiency = df.groupby(['time_bin_5min', 'client_type', 'slot'], observed=True, sort=False).size()
+    time_efficiency_avg = time_efficiency.groupby(['time_bin_5min', 'client_type'], observed=True, sort=False).mean().unstack().sort_index()
+    time_efficiency_avg.index = pd.to_datetime(time_efficiency_avg.index, unit='s')
     metrics['time_efficiency'] = time_efficiency_avg
 
     # Events per slot by event type (ORACLE vs TRADE efficiency)
-    events_per_slot_by_type = df.groupby(['client_type', 'slot', 'kind']).size()
-    efficiency_by_type = events_per_slot_by_type.groupby(['client_type', 'kind']).mean().unstack(fill_value=0)
+    events_per_slot_by_type = df.groupby(['client_type', 'slot', 'kind'], observed=True, sort=False).size()
+    by_type = events_per_slot_by_type.groupby(['client_type', 'kind'], observed=True, sort=False).agg(['mean', 'sum'])
+    efficiency_by_type = by_type['mean'].unstack(fill_value=0)
     metrics['efficiency_by_type'] = efficiency_by_type
 
     # Event type proportions (for context)
-    event_breakdown = df.groupby(['client_type', 'kind']).size().unstack(fill_value=0)
+    event_breakdown = by_type['sum'].unstack(fill_value=0)
     event_breakdown_pct = event_breakdown.div(event_breakdown.sum(axis=1), axis=0) * 100
     metrics['event_breakdown_pct'] = event_breakdown_pct
 
     # Store validator counts and total blocks for context
     metrics['validator_counts'] = validator_counts
-    metrics['total_blocks'] = df.groupby('client_type')['slot'].nunique()
-    metrics['total_events'] = df.groupby('client_type').size()
+    metrics['total_blocks'] = efficiency_stats['count']
+    metrics['total_events'] = efficiency_stats['sum']
 
     # SPIKE WINDOW ANALYSIS: Prepare data for Panel 4
-    # Define spike window constants
-    SPIKE_START = pd.Timestamp('2026-01-07 16:20:00')
-    SPIKE_END = pd.Timestamp('2026-01-07 16:24:59')
-    SPIKE_CONTEXT_START = pd.Timestamp('2026-01-07 16:00:00')
-    SPIKE_CONTEXT_END = pd.Timestamp('2026-01-07 16:40:00')
+    # Define spike window constants (epoch seconds, UTC, comparable to the raw time column)
+    SPIKE_START = int(pd.Timestamp('2026-01-07 16:20:00').timestamp())
+    SPIKE_END = int(pd.Timestamp('2026-01-07 16:24:59').timestamp())
+    SPIKE_CONTEXT_START = int(pd.Timestamp('2026-01-07 16:00:00').timestamp())
+    SPIKE_CONTEXT_END = int(pd.Timestamp('2026-01-07 16:40:00').timestamp())
     PEAK_SLOTS = [391948792, 391948795]
 
     # Filter to context window (40 minutes around spike)
-    df_context = df[
-        (df['datetime'] >= SPIKE_CONTEXT_START) &
-        (df['datetime'] < SPIKE_CONTEXT_END)
-    ].copy()
+    time_arr = df['time'].to_numpy()
+    in_context = (time_arr >= SPIKE_CONTEXT_START) & (time_arr < SPIKE_CONTEXT_END)
+    df_context = df[in_context]
 
     # Calculate events per slot in context window
-    context_scatter = df_context.groupby(['client_type', 'slot']).size().reset_index()
-    context_scatter.columns = ['client_type', 'slot', 'events']
-
-    # Mark which slots are in spike window
-    df_context['in_spike_window'] = (
-        (df_context['datetime'] >= SPIKE_START) &
-        (df_context['datetime'] < SPIKE_END)
+    context_scatter = split_counts_by_client(count_events_per_slot(df_context))
+
+    # Spike window metrics for every client from one groupby over the spike
+    # rows (the spike window lies inside the context window)
+    in_spike_window = (time_arr >= SPIKE_START) & (time_arr < SPIKE_END)
+    spike_events = df[in_spike_window].groupby(['client_type', 'slot'], observed=True, sort=False).size()
+    spike_window_metrics = (
+        spike_events.groupby(level='client_type', observed=True, sort=False)
+        .agg(avg='mean', total_events='sum', blocks='size')
+        .to_dict('index')
     )
 
-    # Calculate spike window metrics
-    spike_window_metrics = {}
-    for client_type in ['Jito-solana', 'Harmonic']:
-        df_client_spike = df_context[
-            (df_context['client_type'] == client_type) &
-            (df_context['in_spike_window'] == True)
-        ]
-
-        if len(df_client_spike) > 0:
-            events_by_slot = df_client_spike.groupby('slot').size()
-            spike_window_metrics[client_type] = {
-                'avg': events_by_slot.mean(),
-                'total_events': len(df_client_spike),
-                'blocks': df_client_spike['slot'].nunique()
-            }
-
     # Store in metrics dict
     metrics['spike_context_scatter'] = context_scatter
     metrics['spike_window_metrics'] = spike_window_metrics
@@ -243,14 +427,17 @@ def create_visualization(metrics):
         vertical_spacing=0.10
     )
 
-    # Panel 1: Raw events per slot scatter plot
-    scatter_data = metrics['scatter_data']
+    # Per-client (slots, events) arrays; Panels 1-2 and the percentile
+    # annotations all index these
+    client_points = metrics['scatter_data']
+
+    # Panel 1: Raw events per slot scatter plot (WebGL; one marker per slot)
     for client_type in ['Jito-solana', 'Harmonic']:
-        client_data = scatter_data[scatter_data['client_type'] == client_type]
+        slots, events = client_points[client_type]
         fig.add_trace(
-            go.Scatter(
-                x=client_data['slot'],
-                y=client_data['events'],
+            go.Scattergl(
+                x=slots,
+                y=events,
                 name=client_type,
                 mode='markers',
                 marker=dict(
@@ -265,11 +452,9 @@ def create_visualization(metrics):
 
     # Panel 2: Box plot with percentile annotations
     for client_type in ['Jito-solana', 'Harmonic']:
-        client_data = scatter_data[scatter_data['client_type'] == client_type]
-
         fig.add_trace(
             go.Box(
-                y=client_data['events'],
+                y=client_points[client_type][1],
                 name=client_type,
                 marker_color=colors[client_type],
                 boxmean='sd',  # Show mean line and standard deviation
@@ -282,14 +467,10 @@ def create_visualization(metrics):
     # Calculate and add text annotations with percentiles
     annotations = []
     for i, client_type in enumerate(['Jito-solana', 'Harmonic']):
-        client_data = scatter_data[scatter_data['client_type'] == client_type]['events']
-
-        # Calculate all key percentiles
-        p25 = client_data.quantile(0.25)
-        p50 = client_data.median()
-        p75 = client_data.quantile(0.75)
-        p95 = client_data.quantile(0.95)
-        p99 = client_data.quantile(0.99)
+        client_data = client_points[client_type][1]
+
+        # Calculate all key percentiles in one pass
+        p25, p50, p75, p95, p99 = np.quantile(client_data, [0.25, 0.5, 0.75, 0.95, 0.99])
         mean_val = client_data.mean()
 
         # Create annotation text
@@ -349,12 +530,12 @@ def create_visualization(metrics):
     spike_metrics = metrics['spike_window_metrics']
     peak_slots = metrics['spike_peak_slots']
 
-    # Plot regular Jito-solana points
-    jito_context = context_scatter[context_scatter['client_type'] == 'Jito-solana']
+    # Plot regular Jito-solana points (marker-only traces are drawn with WebGL)
+    jito_slots, jito_events = context_scatter['Jito-solana']
     fig.add_trace(
-        go.Scatter(
-            x=jito_context['slot'],
-            y=jito_context['events'],
+        go.Scattergl(
+            x=jito_slots,
+            y=jito_events,
             name='Jito-solana',
             mode='markers',
             marker=dict(size=4, color=colors['Jito-solana']),
@@ -365,12 +546,12 @@ def create_visualization(metrics):
     )
 
     # Plot regular Harmonic points (non-peak)
-    harmonic_context = context_scatter[context_scatter['client_type'] == 'Harmonic']
-    harmonic_regular = harmonic_context[~harmonic_context['slot'].isin(peak_slots)]
+    harmonic_slots, harmonic_events = context_scatter['Harmonic']
+    is_peak = np.isin(harmonic_slots, peak_slots)
     fig.add_trace(
-        go.Scatter(
-            x=harmonic_regular['slot'],
-            y=harmonic_regular['events'],
+        go.Scattergl(
+            x=harmonic_slots[~is_peak],
+            y=harmonic_events[~is_peak],
             name='Harmonic',
             mode='markers',
             marker=dict(size=4, color=colors['Harmonic']),
@@ -381,18 +562,17 @@ def create_visualization(metrics):
     )
 
     # Highlight peak slots with special markers
-    harmonic_peaks = harmonic_context[harmonic_context['slot'].isin(peak_slots)]
     fig.add_trace(
         go.Scatter(
-            x=harmonic_peaks['slot'],
-            y=harmonic_peaks['events'],
+            x=harmonic_slots[is_peak],
+            y=harmonic_events[is_peak],
             name='Peak Slots',
             mode='markers+text',
             marker=dict(
                 size=4,
                 color=colors['Harmonic'],
             ),
-            text=[f"{int(row['events'])}" for _, row in harmonic_peaks.iterrows()],
+            text=[str(events) for events in harmonic_events[is_peak]],
             textposition='top center',
             textfont=dict(size=10, color='#8B0000', family='monospace'),
             hovertemplate='<b>PEAK SLOT</b><br>Slot: %{x}<br>Events: %{y}<extra></extra>'
@@ -514,9 +694,15 @@ def create_visualization(metrics):
         hovermode='closest'
     )
 
-    # Save to HTML
+    # Save to HTML, loading plotly.js from the CDN instead of embedding the ~3MB bundle
     output_path = 'validator_client_analysis_20260110.html'
-    fig.write_html(output_path)
+    fig.write_html(
+        output_path,
+        include_plotlyjs='cdn',
+        include_mathjax=False,
+        config={'responsive': True},
+        validate=False
+    )
     print(f"  ✓ Dashboard saved to: {output_path}\n")
 
     return output_path
@@ -622,8 +808,8 @@ def main():
     # Step 1: Parse mapping
     mapping, validator_counts = parse_client_mapping()
 
-    # Step 2: Load and enrich data
-    df = load_and_enrich_data(mapping)
+    # Step 2: Load and enrich data (cached on disk)
+    df = load_cached_data(mapping)
 
     # Step 3: Calculate metrics
     metrics = calculate_metrics(df, validator_counts)
@@ -6,13 +6,16 @@ Compare validator IDs between top_by_client_20260109.txt and outputs folder
 import os
 import re
 
+# Base58 validator IDs (43-44 characters, no 0/O/I/l)
+BASE58_ID_RE = re.compile(r'\b[1-9A-HJ-NP-Za-km-z]{43,44}\b')
+
 # Extract validators from top_by_client_20260109.txt
 top_by_client_validators = set()
 
 with open('top_by_client_20260109.txt', 'r') as f:
     content = f.read()
     # Extract all base58 validator IDs (43-44 character alphanumeric strings)
-    validators = re.findall(r'\b[1-9A-HJ-NP-Za-km-z]{43,44}\b', content)
+    validators = BASE58_ID_RE.findall(content)
     top_by_client_validators.update(validators)
 
 print(f"Found {len(top_by_client_validators)} unique validators in top_by_client_20260109.txt")
@@ -26,10 +29,11 @@ print("\n" + "="*80 + "\n")
 outputs_validators = set()
 outputs_dir = 'outputs'
 
-for filename in os.listdir(outputs_dir):
-    if filename.startswith('validator_') and filename.endswith('.json'):
-        validator_id = filename.replace('validator_', '').replace('.json', '')
-        outputs_validators.add(validator_id)
+with os.scandir(outputs_dir) as entries:
+    for entry in entries:
+        filename = entry.name
+        if filename.startswith('validator_') and filename.endswith('.json'):
+            outputs_validators.add(filename[len('validator_'):-len('.json')])
 
 print(f"Found {len(outputs_validators)} validators in outputs folder")
 
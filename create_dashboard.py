@@ -6,13 +6,321 @@ Author: AI Analysis System
 Date: January 9, 2026
 """
 
+import hashlib
+import inspect
+import os
+import pickle
+
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import plotly.express as px
 
-def create_interactive_dashboard(file_path='pamm_updates_391876700_391976700.parquet',
-                                  output_file='dashboard_propamm.html'):
+# Encode figure JSON with orjson rather than the stdlib json module in write_html
+pio.json.config.default_engine = 'orjson'
+
+PARQUET_PATH = 'pamm_updates_391876700_391976700.parquet'
+
+# Only the columns the panels read; 'sig' is never loaded
+DASHBOARD_COLUMNS = ['time', 'slot', 'validator', 'kind', 'amm']
+
+AGGREGATE_CACHE_DIR = '.cache'
+
+# Index page for the per-panel HTML files; iframes load lazily as they scroll into view
+DASHBOARD_INDEX_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>PropAMM Dataset Analysis Dashboard</title>
+<style>
+  body {{ font-family: sans-serif; max-width: 1600px; margin: 0 auto; padding: 16px; }}
+  h1, p.subtitle {{ text-align: center; }}
+  p.subtitle {{ color: #555; }}
+  .grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 16px; }}
+  .grid iframe {{ width: 100%; height: 460px; border: 0; }}
+  .grid iframe.wide {{ grid-column: span 2; height: 520px; }}
+</style>
+</head>
+<body>
+<h1>PropAMM Dataset Analysis Dashboard</h1>
+<p class="subtitle">Data Range: {start} to {end} | Total Events: {total_events:,}</p>
+<div class="grid">
+{panels}
+</div>
+</body>
+</html>
+"""
+
+# Pixel columns Panel 4's line is decimated to (M4: first/last/min/max per column)
+M4_WIDTH = 1200
+
+# Panel 1 stacks this many AMMs by volume; the rest are summed into 'Other'
+TOP_AMM_TRACES = 8
+
+# Upper bound on points handed to any single trace; every panel ships an aggregate
+MAX_TRACE_POINTS = 100_000
+
+# Low-cardinality string columns decoded by Arrow as dictionaries, so they
+# reach pandas as categoricals and value_counts hashes integer codes
+DICTIONARY_COLUMNS = ['validator', 'kind', 'amm']
+
+
+def preprocess(df):
+    """
+    Add the derived columns the panels group by (5-min bin, amm_clean).
+    
+    Skipped when the frame already carries them, so a DataFrame loaded once
+    can be passed to any number of dashboard builds.
+    """
+    if 'time_bin_5min' in df.columns:
+        return df
+    
+    # Integer floor on epoch seconds; only the bin labels are converted to datetimes
+    df['time_bin_5min'] = df['time'] // 300 * 300
+    df['amm'] = df['amm'].astype('category')
+    amm = df['amm']
+    # The parquet dictionary may already hold 'Unknown'; adding it twice raises
+    if 'Unknown' not in amm.cat.categories:
+        amm = amm.cat.add_categories(['Unknown'])
+    df['amm_clean'] = amm.fillna('Unknown')
+    return df
+
+
+def m4_decimate(x, y, width=M4_WIDTH):
+    """
+    Reduce a line to the first, last, min and max point of each of `width` x buckets
+    
+    Unlike stride sampling this keeps every peak and trough the screen can
+    show. x must be sorted ascending; NaN y values (rolling-window edges) are
+    dropped first.
+    """
+    keep = ~np.isnan(y)
+    x, y = x[keep], y[keep]
+    if len(x) <= 4 * width:
+        return x, y
+    
+    buckets = (x - x[0]) * width // (x[-1] - x[0] + 1)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(x)] - 1
+    # Ordered by bucket, then y: each bucket's min/max sit at its start/end position
+    by_value = np.lexsort((y, buckets))
+    idx = np.unique(np.concatenate([starts, ends, by_value[starts], by_value[ends]]))
+    return x[idx], y[idx]
+
+
+def centered_moving_average(values, window):
+    """
+    Centered moving average of an integer array via one cumulative sum
+    
+    Matches pandas rolling(window, center=True).mean(): positions without a
+    full window are NaN.
+    """
+    csum = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+    means = (csum[window:] - csum[:-window]) / window
+    
+    ma = np.full(len(values), np.nan)
+    shift = window // 2
+    ma[shift:shift + len(means)] = means
+    return ma
+
+
+def count_events(df):
+    """
+    Mergeable event counts behind every panel, for one frame or one record batch
+    
+    All panels are associative reductions of these counts, so counts from
+    separate batches can be combined with merge_counts before the final
+    per-panel aggregation.
+    """
+    # Slots are a dense integer range: count with one bincount over the offsets
+    slots = df['slot'].to_numpy()
+    first_slot = int(slots.min())
+    return {
+        'activity': df.groupby(['time_bin_5min', 'amm_clean'], observed=True).size(),
+        # Market share excludes everything amm_clean labels 'Unknown': value_counts
+        # skips the nulls, and literal 'Unknown' values are dropped explicitly
+        'amm': df['amm'].value_counts().drop('Unknown', errors='ignore'),
+        'kind': df['kind'].value_counts(),
+        # validator is categorical, so value_counts counts codes
+        'validator': df['validator'].value_counts(),
+        'first_slot': first_slot,
+        'slot_counts': np.bincount((slots - first_slot).astype(np.int64)),
+        'time_min': int(df['time'].min()),
+        'time_max': int(df['time'].max()),
+        'total_events': len(df),
+    }
+
+
+def merge_counts(total, counts):
+    """
+    Combine two count_events results
+    """
+    def add_series(a, b):
+        # Batches can carry different dictionaries, so align on the labels
+        merged = pd.concat([a, b])
+        return merged.groupby(level=list(range(merged.index.nlevels)), observed=True).sum()
+    
+    first_slot = min(total['first_slot'], counts['first_slot'])
+    slot_end = max(total['first_slot'] + len(total['slot_counts']),
+                   counts['first_slot'] + len(counts['slot_counts']))
+    slot_counts = np.zeros(slot_end - first_slot, dtype=np.int64)
+    for part in (total, counts):
+        offset = part['first_slot'] - first_slot
+        slot_counts[offset:offset + len(part['slot_counts'])] += part['slot_counts']
+    
+    return {
+        'activity': add_series(total['activity'], counts['activity']),
+        'amm': add_series(total['amm'], counts['amm']),
+        'kind': add_series(total['kind'], counts['kind']),
+        'validator': add_series(total['validator'], counts['validator']),
+        'first_slot': first_slot,
+        'slot_counts': slot_counts,
+        'time_min': min(total['time_min'], counts['time_min']),
+        'time_max': max(total['time_max'], counts['time_max']),
+        'total_events': total['total_events'] + counts['total_events'],
+    }
+
+
+def agg_timeline(activity_counts):
+    """
+    Events per (5-min bin x AMM), largest AMMs first with the tail summed into 'Other'
+    """
+    # Dense (time bin x AMM) grid: each trace is one column, all sharing one x array
+    activity_ts = activity_counts.unstack(fill_value=0)
+    
+    amm_totals = activity_ts.sum().sort_values(ascending=False)
+    top_amms = amm_totals.index[:TOP_AMM_TRACES]
+    if len(amm_totals) > TOP_AMM_TRACES:
+        other = activity_ts.drop(columns=top_amms).sum(axis=1)
+        return activity_ts[top_amms].assign(Other=other)
+    return activity_ts[top_amms]
+
+
+def agg_value_counts(counts, n=None):
+    """
+    Non-zero counts, largest first, optionally only the top n
+    """
+    counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+    return counts if n is None else counts.head(n)
+
+
+def agg_block_throughput(first_slot, slot_counts, window=100):
+    """
+    M4-decimated (slots, moving average) of events per block
+    """
+    # Keep only slots with events (produced blocks)
+    block_offsets = np.flatnonzero(slot_counts)
+    tx_count_ma = centered_moving_average(slot_counts[block_offsets], window=window)
+    
+    # Min/max per pixel column instead of sampling every 10th block
+    return m4_decimate(block_offsets + first_slot, tx_count_ma)
+
+
+def aggregate_dashboard_data(counts):
+    """
+    Reduce count_events output to the small per-panel aggregates the figure is built from
+    
+    Nothing per-event reaches Plotly; each aggregate is checked against
+    MAX_TRACE_POINTS so a regression that ships raw rows fails loudly.
+    """
+    aggregates = {
+        'activity_ts': agg_timeline(counts['activity']),
+        'amm_counts': agg_value_counts(counts['amm']),
+        'event_counts': agg_value_counts(counts['kind']),
+        'block_ma': agg_block_throughput(counts['first_slot'], counts['slot_counts']),
+        'top_validators': agg_value_counts(counts['validator'], n=10),
+    }
+    for name, agg in aggregates.items():
+        points = len(agg[0]) if isinstance(agg, tuple) else agg.size
+        assert points < MAX_TRACE_POINTS, f"{name} has {points:,} points"
+    
+    aggregates['time_range'] = tuple(pd.to_datetime([counts['time_min'], counts['time_max']], unit='s'))
+    aggregates['total_events'] = counts['total_events']
+    return aggregates
+
+
+def aggregate_parquet_batches(file_path=PARQUET_PATH, batch_size=2**20):
+    """
+    Compute the dashboard aggregates by streaming the parquet in record batches
+    
+    Each batch is reduced with count_events and merged into running totals,
+    so peak memory is one batch plus the counts regardless of file size.
+    """
+    print("\n📂 Streaming data...")
+    parquet_file = pq.ParquetFile(file_path, read_dictionary=DICTIONARY_COLUMNS)
+    
+    total = None
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=DASHBOARD_COLUMNS):
+        counts = count_events(preprocess(batch.to_pandas()))
+        total = counts if total is None else merge_counts(total, counts)
+    
+    return aggregate_dashboard_data(total)
+
+
+def load_cached_aggregates(file_path=PARQUET_PATH):
+    """
+    Return the dashboard aggregates for file_path, streaming the file only on a cache miss
+    
+    Aggregates are pickled under AGGREGATE_CACHE_DIR keyed by the file path,
+    its mtime, the aggregation settings and the source of the aggregation
+    functions, so re-runs while iterating on the figure styling skip the
+    parquet entirely, while edits to the aggregation code invalidate the cache.
+    """
+    producers = (preprocess, m4_decimate, centered_moving_average, count_events, merge_counts,
+                 agg_timeline, agg_value_counts, agg_block_throughput,
+                 aggregate_dashboard_data, aggregate_parquet_batches)
+    spec = (os.path.abspath(file_path), os.stat(file_path).st_mtime_ns,
+            DASHBOARD_COLUMNS, TOP_AMM_TRACES, M4_WIDTH,
+            "".join(inspect.getsource(f) for f in producers))
+    key = hashlib.blake2b(repr(spec).encode(), digest_size=16).hexdigest()
+    cache_path = os.path.join(AGGREGATE_CACHE_DIR, f"dashboard_{key}.pkl")
+    
+    if os.path.exists(cache_path):
+        print(f"\n📦 Loading cached aggregates from {cache_path}")
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            # e.g. a file truncated by an interrupted run: recompute and overwrite it
+            print(f"⚠️  Ignoring unreadable aggregate cache ({e})")
+    
+    aggregates = aggregate_parquet_batches(file_path)
+    
+    # Write to a temporary name and swap in, so an interrupted run never leaves a partial pickle
+    os.makedirs(AGGREGATE_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(aggregates, f)
+    os.replace(tmp_path, cache_path)
+    
+    # Older keys (previous mtimes or aggregation code) can never be hit again
+    with os.scandir(AGGREGATE_CACHE_DIR) as entries:
+        for entry in entries:
+            if (entry.name.startswith('dashboard_') and entry.name.endswith('.pkl')
+                    and entry.path != cache_path):
+                os.remove(entry.path)
+    
+    return aggregates
+
+
+def write_panel_html(fig, path):
+    """
+    Write one panel figure as a standalone HTML page loading plotly.js from the CDN
+    """
+    fig.write_html(
+        path,
+        include_plotlyjs='cdn',
+        include_mathjax=False,
+        config={'responsive': True},
+        validate=False
+    )
+
+
+def create_interactive_dashboard(file_path=PARQUET_PATH,
+                                  output_file='dashboard_propamm.html',
+                                  df=None):
     """
     Create a comprehensive interactive dashboard with multiple panels
     
@@ -21,71 +329,75 @@ def create_interactive_dashboard(file_path='pamm_updates_391876700_391976700.par
     2. Event type breakdown
     3. Protocol market share
     4. Block throughput metrics
+    5. Top validators
+    
+    Each panel is its own small figure written to <output stem>_panel<N>.html;
+    output_file is an index page that lazy-loads them in iframes, so each
+    panel lays out and renders independently.
+    
+    Returns the list of the five panel figures (in panel order), not one
+    combined Figure.
+    
+    By default file_path is streamed in record batches (or its cached
+    aggregates reused); pass an already loaded DataFrame holding
+    DASHBOARD_COLUMNS as df to aggregate it in memory instead.
     """
     
     print("="*70)
     print("CREATING INTERACTIVE PROPAMM DASHBOARD")
     print("="*70)
     
-    # Load data
-    print("\n📂 Loading data...")
-    df = pd.read_parquet(file_path)
-    
-    # Preprocess
-    print("🔧 Preprocessing...")
-    df['datetime'] = pd.to_datetime(df['time'], unit='s')
-    df['time_bin_5min'] = df['datetime'].dt.floor('5min')
-    df['amm_clean'] = df['amm'].fillna('Unknown')
-    
-    # Create subplots with custom layout
-    print("📊 Creating dashboard layout...")
-    fig = make_subplots(
-        rows=3, cols=2,
-        subplot_titles=(
-            'AMM Activity Timeline (5-min intervals)',
-            'Protocol Market Share',
-            'Event Type Distribution',
-            'Transactions Per Block (Rolling Avg)',
-            'Hourly Activity Heatmap',
-            'Top 10 Most Active Validators'
-        ),
-        specs=[
-            [{"type": "scatter", "colspan": 2}, None],
-            [{"type": "pie"}, {"type": "bar"}],
-            [{"type": "scatter"}, {"type": "bar"}]
-        ],
-        row_heights=[0.35, 0.35, 0.3],
-        vertical_spacing=0.12,
-        horizontal_spacing=0.15
-    )
+    # Every panel is drawn from these small aggregates, never from per-event rows
+    if df is None:
+        aggregates = load_cached_aggregates(file_path)
+    else:
+        print("🧮 Aggregating...")
+        aggregates = aggregate_dashboard_data(count_events(preprocess(df)))
+    
+    print("📊 Creating dashboard panels...")
+    panels = []  # (figure, full grid width)
     
     # ========================================================================
     # PANEL 1: Time Series - AMM Activity
     # ========================================================================
     print("  Adding Panel 1: Time Series...")
-    activity_ts = df.groupby(['time_bin_5min', 'amm_clean']).size().reset_index(name='count')
+    activity_ts = aggregates['activity_ts']
+    time_bins = pd.to_datetime(activity_ts.index, unit='s').to_numpy()
     
-    for amm in activity_ts['amm_clean'].unique():
-        amm_data = activity_ts[activity_ts['amm_clean'] == amm]
+    fig = go.Figure()
+    for amm in activity_ts.columns:
         fig.add_trace(
             go.Scatter(
-                x=amm_data['time_bin_5min'],
-                y=amm_data['count'],
+                x=time_bins,
+                y=activity_ts[amm].to_numpy(),
                 mode='lines',
                 name=amm,
                 stackgroup='one',
                 hovertemplate='<b>%{fullData.name}</b><br>Time: %{x}<br>Events: %{y}<extra></extra>'
-            ),
-            row=1, col=1
+            )
         )
+    fig.update_layout(
+        title='AMM Activity Timeline (5-min intervals)',
+        xaxis_title='Time',
+        yaxis_title='Events',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5
+        ),
+        hovermode='closest'
+    )
+    panels.append((fig, True))
     
     # ========================================================================
     # PANEL 2: Pie Chart - Protocol Market Share
     # ========================================================================
     print("  Adding Panel 2: Market Share...")
-    amm_counts = df[df['amm_clean'] != 'Unknown']['amm_clean'].value_counts()
+    amm_counts = aggregates['amm_counts']
     
-    fig.add_trace(
+    fig = go.Figure(
         go.Pie(
             labels=amm_counts.index,
             values=amm_counts.values,
@@ -93,17 +405,18 @@ def create_interactive_dashboard(file_path='pamm_updates_391876700_391976700.par
             textinfo='label+percent',
             showlegend=False,
             hovertemplate='<b>%{label}</b><br>Events: %{value:,}<br>Share: %{percent}<extra></extra>'
-        ),
-        row=2, col=1
+        )
     )
+    fig.update_layout(title='Protocol Market Share')
+    panels.append((fig, False))
     
     # ========================================================================
     # PANEL 3: Bar Chart - Event Types
     # ========================================================================
     print("  Adding Panel 3: Event Types...")
-    event_counts = df['kind'].value_counts()
+    event_counts = aggregates['event_counts']
     
-    fig.add_trace(
+    fig = go.Figure(
         go.Bar(
             x=event_counts.index,
             y=event_counts.values,
@@ -113,43 +426,43 @@ def create_interactive_dashboard(file_path='pamm_updates_391876700_391976700.par
             textposition='outside',
             showlegend=False,
             hovertemplate='<b>%{x}</b><br>Count: %{y:,}<extra></extra>'
-        ),
-        row=2, col=2
+        )
     )
+    fig.update_layout(title='Event Type Distribution', yaxis_title='Count')
+    panels.append((fig, False))
     
     # ========================================================================
     # PANEL 4: Line Chart - Blocks with Rolling Average
     # ========================================================================
     print("  Adding Panel 4: Block Throughput...")
-    tx_per_block = df.groupby('slot').size().reset_index(name='tx_count')
-    tx_per_block['tx_count_ma'] = tx_per_block['tx_count'].rolling(
-        window=100, center=True
-    ).mean()
-    
-    # Sample for performance (every 10th block)
-    tx_sample = tx_per_block.iloc[::10]
-    
-    fig.add_trace(
-        go.Scatter(
-            x=tx_sample['slot'],
-            y=tx_sample['tx_count_ma'],
+    ma_slots, ma_values = aggregates['block_ma']
+    
+    fig = go.Figure(
+        go.Scattergl(
+            x=ma_slots,
+            y=ma_values,
             mode='lines',
             name='100-block MA',
             line=dict(color='#E63946', width=2),
             showlegend=False,
             hovertemplate='Block: %{x}<br>Avg Tx: %{y:.1f}<extra></extra>'
-        ),
-        row=3, col=1
+        )
+    )
+    fig.update_layout(
+        title='Transactions Per Block (Rolling Avg)',
+        xaxis_title='Block Number',
+        yaxis_title='Tx Count'
     )
+    panels.append((fig, False))
     
     # ========================================================================
     # PANEL 5: Bar Chart - Top Validators
     # ========================================================================
     print("  Adding Panel 5: Top Validators...")
-    top_validators = df['validator'].value_counts().head(10)
-    validator_labels = [v[:8] + '...' for v in top_validators.index]
+    top_validators = aggregates['top_validators']
+    validator_labels = top_validators.index.str.slice(0, 8) + '...'
     
-    fig.add_trace(
+    fig = go.Figure(
         go.Bar(
             x=top_validators.values,
             y=validator_labels,
@@ -160,67 +473,52 @@ def create_interactive_dashboard(file_path='pamm_updates_391876700_391976700.par
             textposition='outside',
             showlegend=False,
             hovertemplate='<b>%{y}</b><br>Events: %{x:,}<extra></extra>'
-        ),
-        row=3, col=2
+        )
     )
+    fig.update_layout(title='Top 10 Most Active Validators', xaxis_title='Event Count')
+    panels.append((fig, False))
     
     # ========================================================================
-    # UPDATE LAYOUT
+    # WRITE PANELS + INDEX
     # ========================================================================
-    print("🎨 Finalizing layout...")
-    
-    # Update axes labels
-    fig.update_xaxes(title_text="Time", row=1, col=1)
-    fig.update_yaxes(title_text="Events", row=1, col=1)
-    
-    fig.update_yaxes(title_text="Count", row=2, col=2)
-    
-    fig.update_xaxes(title_text="Block Number", row=3, col=1)
-    fig.update_yaxes(title_text="Tx Count", row=3, col=1)
-    
-    fig.update_xaxes(title_text="Event Count", row=3, col=2)
+    print(f"\n💾 Saving dashboard to {output_file}...")
+    output_dir = os.path.dirname(output_file)
+    stem = os.path.splitext(os.path.basename(output_file))[0]
     
-    # Overall layout
-    fig.update_layout(
-        title={
-            'text': '<b>PropAMM Dataset Analysis Dashboard</b><br>' + 
-                    f'<sub>Data Range: {df["datetime"].min()} to {df["datetime"].max()} | ' + 
-                    f'Total Events: {len(df):,}</sub>',
-            'x': 0.5,
-            'xanchor': 'center',
-            'font': {'size': 20}
-        },
-        height=1400,
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="center",
-            x=0.5
-        ),
-        hovermode='closest'
-    )
+    iframes = []
+    for i, (fig, wide) in enumerate(panels, start=1):
+        panel_file = f"{stem}_panel{i}.html"
+        write_panel_html(fig, os.path.join(output_dir, panel_file))
+        css_class = ' class="wide"' if wide else ''
+        iframes.append(
+            f'<iframe{css_class} src="{panel_file}" loading="lazy" '
+            f'title="{fig.layout.title.text}"></iframe>'
+        )
     
-    # Save to HTML
-    print(f"\n💾 Saving dashboard to {output_file}...")
-    fig.write_html(output_file)
+    data_start, data_end = aggregates['time_range']
+    with open(output_file, 'w') as f:
+        f.write(DASHBOARD_INDEX_TEMPLATE.format(
+            start=data_start,
+            end=data_end,
+            total_events=aggregates['total_events'],
+            panels='\n'.join(iframes)
+        ))
     
     print("="*70)
     print("✅ DASHBOARD CREATED SUCCESSFULLY!")
     print("="*70)
     print(f"\n📊 Dashboard saved to: {output_file}")
-    print(f"📈 Total panels: 5")
-    print(f"📉 Data points visualized: {len(df):,}")
+    print(f"📈 Total panels: {len(panels)}")
+    print(f"📉 Data points visualized: {aggregates['total_events']:,}")
     print(f"\n🌐 Open {output_file} in your web browser to explore the interactive dashboard")
     print("="*70)
     
-    return fig
+    return [fig for fig, _ in panels]
 
 # ========================================================================
 # MAIN
 # ========================================================================
 
 if __name__ == "__main__":
-    # Create main dashboard
+    # Create main dashboard (streams the parquet; peak memory is one batch)
     create_interactive_dashboard()
\ No newline at end of file
@@ -4,11 +4,12 @@ Extract the top 20 validators running Jito-solana (by slots processed)
 Reads from top100_validators_by_slots.txt and checks client info in outputs folder
 """
 
-import json
 import os
 import re
 from datetime import datetime
 
+import orjson
+
 def parse_top100_file(filename):
     """Parse the top100 validators file and return list of (rank, validator_id, slots, events)"""
     validators = []
@@ -34,23 +35,32 @@ def parse_top100_file(filename):
 
     return validators
 
-def get_validator_client_info(validator_id, outputs_dir='outputs'):
-    """Check if validator JSON exists and return client info"""
-    json_path = os.path.join(outputs_dir, f'validator_{validator_id}.json')
+def index_validator_json(outputs_dir='outputs'):
+    """Map validator ID -> JSON path with a single directory scan"""
+    with os.scandir(outputs_dir) as entries:
+        return {
+            entry.name[len('validator_'):-len('.json')]: entry.path
+            for entry in entries
+            if entry.name.startswith('validator_') and entry.name.endswith('.json')
+        }
+
+def get_validator_client_info(validator_id, json_index):
+    """Look up the validator's JSON in the directory index and return client info"""
+    json_path = json_index.get(validator_id)
 
-    if not os.path.exists(json_path):
+    if json_path is None:
         return None
 
     try:
-        with open(json_path, 'r') as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
             return {
                 'software_client': data.get('software_client'),
                 'software_client_id': data.get('software_client_id'),
                 'name': data.get('name', 'Unknown'),
                 'vote_account': data.get('vote_account', validator_id)
             }
-    except (json.JSONDecodeError, FileNotFoundError):
+    except (orjson.JSONDecodeError, FileNotFoundError):
         return None
 
 def main():
@@ -66,6 +76,9 @@ def main():
     print(f"Parsed {len(validators)} validators from {top100_file}")
     print()
 
+    # One scan of outputs/ instead of an exists() check per validator
+    json_index = index_validator_json()
+
     # Find top 20 Jito validators
     jito_validators = []
     checked_count = 0
@@ -75,7 +88,7 @@ def main():
         checked_count += 1
 
         # Get client info from JSON file
-        client_info = get_validator_client_info(validator_id)
+        client_info = get_validator_client_info(validator_id, json_index)
 
         if client_info is None:
             missing_json.append((rank, validator_id))
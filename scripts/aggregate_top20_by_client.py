@@ -1,15 +1,21 @@
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from glob import glob
+
+import numpy as np
+import orjson
+import pandas as pd
 
 def get_validator_files(outputs_dir):
-    return glob(os.path.join(outputs_dir, "validator_*.json"))
+    # One directory pass with plain prefix/suffix checks instead of glob's fnmatch
+    with os.scandir(outputs_dir) as it:
+        return [e.path for e in it
+                if e.name.startswith("validator_") and e.name.endswith(".json") and e.is_file()]
 
 def extract_validator_info(filepath):
     try:
-        with open(filepath) as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
         validator_id = os.path.basename(filepath).replace("validator_", "").replace(".json", "")
         client = data.get("software_client")
         client_id = data.get("software_client_id")
@@ -31,35 +37,30 @@ def main():
     files = get_validator_files(outputs_dir)
     validators = []
     errors = []
-    for file in files:
-        info = extract_validator_info(file)
+    # Small I/O-bound files: overlap the reads, keep results in file order
+    with ThreadPoolExecutor() as ex:
+        infos = list(ex.map(extract_validator_info, files))
+    for info in infos:
         if "error" in info:
             errors.append(info)
         else:
             validators.append(info)
 
-    # Group by client type
+    # Group by client type and keep each group's top 20 with one vectorized sort
+    vdf = pd.DataFrame(validators, columns=["validator_id", "software_client", "software_client_id", "slots", "events"], dtype=object)
+    slots_key = pd.to_numeric(vdf["slots"], errors="coerce").fillna(0).astype(np.int64)
+    events_key = pd.to_numeric(vdf["events"], errors="coerce").fillna(0).astype(np.int64)
+    cond_jito = (vdf["software_client"] == "JitoLabs") & (vdf["software_client_id"] == 1)
+    cond_harmonic = (vdf["software_client"].isna() | (vdf["software_client"] == "Unknown")) & (vdf["software_client_id"] == 10)
+    vdf["group"] = np.where(cond_jito, "Jito-solana", np.where(cond_harmonic, "Harmonic", "Other"))
+
+    # Sort by slots, then events (both descending), then validator_id
+    order = np.lexsort((vdf["validator_id"].to_numpy(dtype=str), -events_key.to_numpy(), -slots_key.to_numpy()))
+    top = vdf.iloc[order].groupby("group", sort=False).head(20)
     client_groups = {
-        "Jito-solana": [],
-        "Harmonic": [],
-        "Other": []
+        group: top[top["group"] == group].to_dict("records")
+        for group in ["Jito-solana", "Harmonic", "Other"]
     }
-    for v in validators:
-        if v["software_client"] == "JitoLabs" and v["software_client_id"] == 1:
-            client_groups["Jito-solana"].append(v)
-        elif (v["software_client"] == "Unknown" or v["software_client"] is None) and v["software_client_id"] == 10:
-            client_groups["Harmonic"].append(v)
-        else:
-            client_groups["Other"].append(v)
-
-    # Sort by slots, then events, then validator_id
-    def sort_key(v):
-        slots = v["slots"] if v["slots"] is not None else 0
-        events = v["events"] if v["events"] is not None else 0
-        return (-int(slots), -int(events), v["validator_id"])
-
-    for group in client_groups:
-        client_groups[group] = sorted(client_groups[group], key=sort_key)[:20]
 
     # Write output
     today = datetime.now().strftime("%Y%m%d")
@@ -1,30 +1,36 @@
+import csv
+import functools
 import os
+import re
 from dotenv import load_dotenv
 import json
+import threading
 import time
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 
+RANK_LINE_RE = re.compile(r'^\s*(\d+)\s+(\S+)')
+
 # Extract validator IDs for ranks 21-100 from top100_validators_by_slots.txt
 def extract_validator_ids(filepath, start_rank=21, end_rank=100):
     ids = []
     with open(filepath) as f:
         for line in f:
-            line = line.strip()
-            if not line or line.startswith('#') or line.startswith('Rank') or line.startswith('-'):
-                continue
-            parts = line.split()
-            if len(parts) < 2:
-                continue
-            try:
-                rank = int(parts[0])
-            except ValueError:
+            m = RANK_LINE_RE.match(line)
+            if not m:
                 continue
-            if start_rank <= rank <= end_rank:
-                ids.append(parts[1])
+            rank = int(m.group(1))
+            # The file is rank-ordered, so nothing past end_rank is needed
+            if rank > end_rank:
+                break
+            if rank >= start_rank:
+                ids.append(m.group(2))
     return ids
 
+@functools.lru_cache(maxsize=1)
 def get_top100_path():
     # Try both possible locations
     candidates = [
@@ -36,7 +42,12 @@ def get_top100_path():
         os.path.abspath(os.path.join(os.path.dirname(__file__), "top100_validators_by_slots.txt")),
         "top100_validators_by_slots.txt"
     ]
-    for path in candidates:
+    # Several candidates resolve to the same file; probe each distinct path once
+    seen = set()
+    for path in map(os.path.abspath, candidates):
+        if path in seen:
+            continue
+        seen.add(path)
         if os.path.exists(path):
             return path
     raise FileNotFoundError("Could not find top100_validators_by_slots.txt")
@@ -51,23 +62,60 @@ if not API_TOKEN:
 HEADERS = {"Token": API_TOKEN}
 OUTPUT_DIR = "outputs"
 LOG_FILE = os.path.join(OUTPUT_DIR, "fetch_log.txt")
+MAX_WORKERS = 8
+REQUEST_INTERVAL = 7  # seconds between API requests, to stay under the rate limit
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# One keep-alive session shared by all workers
+session = requests.Session()
+session.headers.update(HEADERS)
+
+_log_lock = threading.Lock()
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+def wait_for_rate_limit():
+    # Space request starts REQUEST_INTERVAL apart across all threads; cached validators never wait
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
 def log(msg):
-    print(msg)
-    with open(LOG_FILE, "a") as f:
-        f.write(f"{datetime.now().isoformat()} | {msg}\n")
+    with _log_lock:
+        print(msg)
+        with open(LOG_FILE, "a") as f:
+            f.write(f"{datetime.now().isoformat()} | {msg}\n")
+
+def save_client_meta(meta_path, data):
+    # Small sidecar with just the client fields, so reruns skip parsing the full payload.
+    # Not named *.json so the validator_*.json scans elsewhere don't pick it up.
+    with open(meta_path, "wb") as f:
+        f.write(orjson.dumps({
+            "software_client": data.get("software_client"),
+            "software_client_id": data.get("software_client_id")
+        }))
 
 def fetch_and_save(validator_id):
     url = API_URL.format(validator_id)
     out_path = os.path.join(OUTPUT_DIR, f"validator_{validator_id}.json")
+    meta_path = os.path.join(OUTPUT_DIR, f"validator_{validator_id}.meta")
     if os.path.exists(out_path):
         log(f"SKIP: {validator_id} | already exists")
         # Try to read existing file for aggregation
         try:
-            with open(out_path) as f:
-                data = json.load(f)
+            try:
+                with open(meta_path, "rb") as f:
+                    data = orjson.loads(f.read())
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                # No usable sidecar yet: fall back to the full JSON once and write one
+                with open(out_path, "rb") as f:
+                    data = orjson.loads(f.read())
+                save_client_meta(meta_path, data)
             return {
                 "validator_id": validator_id,
                 "software_client": data.get("software_client"),
@@ -82,11 +130,13 @@ def fetch_and_save(validator_id):
                 "error": f"read error: {e}"
             }
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=15)
+        wait_for_rate_limit()
+        resp = session.get(url, timeout=15)
         resp.raise_for_status()
         data = resp.json()
         with open(out_path, "w") as f:
             json.dump(data, f, indent=2)
+        save_client_meta(meta_path, data)
         log(f"SUCCESS: {validator_id} | software_client: {data.get('software_client')} | software_client_id: {data.get('software_client_id')}")
         return {
             "validator_id": validator_id,
@@ -103,17 +153,21 @@ def fetch_and_save(validator_id):
         }
 
 def main():
-    results = []
-    for vid in VALIDATOR_IDS:
-        result = fetch_and_save(vid)
-        results.append(result)
-        time.sleep(7)  # increased delay to avoid rate limit
+    # Overlap request latency across workers; the shared limiter still paces the API calls
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        results = list(ex.map(fetch_and_save, VALIDATOR_IDS))
     # Save CSV for ranks 21-100
     csv_path = os.path.join(OUTPUT_DIR, f"validator_clients_21_100_{datetime.now().strftime('%Y%m%d')}.csv")
-    with open(csv_path, "w") as f:
-        f.write("validator_id,software_client,software_client_id,error\n")
-        for r in results:
-            f.write(f"{r['validator_id']},{r.get('software_client','')},{r.get('software_client_id','')},{r.get('error','')}\n")
+    # Same columns and values as before; QUOTE_MINIMAL quotes only fields that need it
+    # (e.g. error messages with commas). Values are written as text, so mixed
+    # int/str client IDs cannot fail after all the requests have run
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["validator_id", "software_client", "software_client_id", "error"])
+        writer.writerows(
+            [r["validator_id"], f"{r.get('software_client', '')}", f"{r.get('software_client_id', '')}", f"{r.get('error', '')}"]
+            for r in results
+        )
     log(f"Saved CSV: {csv_path}")
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""
+One-time sorted copy of the PropAMM parquet file.
+
+Rows are ordered by (validator, slot) and written to a separate file with
+zstd compression, dictionary encoding and column statistics, so each row
+group covers a narrow validator range. The source file is never modified.
+Readers that filter on a small validator set (e.g. the analyze_validator_clients
+scans) can then skip row groups from their min/max statistics instead of
+decoding the whole file.
+"""
+
+import os
+import sys
+import pyarrow.parquet as pq
+
+DEFAULT_PARQUET_PATH = "pamm_updates_391876700_391976700.parquet"
+DEFAULT_SORTED_PATH = "pamm_updates_391876700_391976700_sorted.parquet"
+ROW_GROUP_SIZE = 256 * 1024
+
+
+def sort_parquet_by_validator(path, out_path, row_group_size=ROW_GROUP_SIZE):
+    if os.path.abspath(out_path) == os.path.abspath(path):
+        raise ValueError("Refusing to overwrite the source parquet; choose a different output path")
+    table = pq.read_table(path)
+    table = table.sort_by([("validator", "ascending"), ("slot", "ascending")])
+
+    # Write to a temporary name so a failed run never leaves a partial sorted copy
+    tmp_path = f"{out_path}.sorting"
+    pq.write_table(
+        table,
+        tmp_path,
+        row_group_size=row_group_size,
+        use_dictionary=True,
+        compression="zstd",
+        write_statistics=True,
+    )
+    os.replace(tmp_path, out_path)
+    return table.num_rows, pq.ParquetFile(out_path).num_row_groups
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PARQUET_PATH
+    out_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_SORTED_PATH
+    print(f"Sorting {path} by validator into {out_path}...")
+    num_rows, num_row_groups = sort_parquet_by_validator(path, out_path)
+    print(f"Wrote {num_rows:,} rows into {num_row_groups} row groups")
+
+if __name__ == "__main__":
+    main()